@@ -12,6 +12,7 @@ Classes
 import copy
 from collections import OrderedDict
 from inspect import isclass
+from operator import attrgetter
 from typing import (
     Any,
     Callable,
@@ -24,6 +25,8 @@ from typing import (
     Union,
 )
 
+import numpy as np
+
 from .utils import yaml_dump
 
 __all__ = ["Base", "ComplexBase"]
@@ -88,6 +91,7 @@ class Base:
 
     """
 
+    __slots__ = ()
     _attributes: Mapping[str, Any] = {}
     _optional_attributes: List[str] = []
     _list_attributes: List[str] = []
@@ -136,6 +140,22 @@ class Base:
             return True
         return False
 
+    def __getstate__(self) -> dict:
+        # NOTE: Use a plain dictionary as the state so that pickles stay
+        # compatible with versions without `__slots__`
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if slot not in ("__dict__", "__weakref__") and hasattr(
+                    self, slot
+                ):
+                    state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state: dict):
+        for key, value in state.items():
+            setattr(self, key, value)
+
     def __deepcopy__(self: BaseT, memo: dict) -> BaseT:
         return self.from_dict(self.to_ordered_dict())
 
@@ -402,19 +422,11 @@ class Base:
 
     def _validate(self, attr: str, recursive: bool):
         attr_type = self._attributes[attr]
-        if isclass(attr_type) and issubclass(attr_type, Base):
-            if attr in self._list_attributes:
-                if getattr(self, attr):
-                    for item in getattr(self, attr):
-                        item.validate()
-            else:
-                getattr(self, attr).validate()
-        else:
-            # Set recursive=False to avoid repeated checks invoked when
-            # calling `validate` recursively
-            self._validate_attr_type(attr, False)
-            if attr == "time" and getattr(self, "time") < 0:
-                raise ValueError("`time` must be nonnegative.")
+        # Set recursive=False to avoid repeated checks invoked when
+        # calling `validate` recursively
+        self._validate_attr_type(attr, False)
+        if attr == "time" and getattr(self, "time") < 0:
+            raise ValueError("`time` must be nonnegative.")
 
         # Apply recursively
         if recursive and isclass(attr_type) and issubclass(attr_type, Base):
@@ -629,6 +641,9 @@ class ComplexBase(Base):
 
     """
 
+    __slots__ = ()
+    _list_attribute_table: Dict[type, str]
+
     def __iadd__(
         self: ComplexBaseT, other: Union[ComplexBaseT, Iterable]
     ) -> ComplexBaseT:
@@ -642,20 +657,39 @@ class ComplexBase(Base):
             )
         return self.deepcopy().extend(other, deepcopy=True)
 
-    def _append(self, obj):
-        for attr in self._list_attributes:
-            attr_type = self._attributes[attr]
-            if isinstance(obj, attr_type):
-                if isclass(attr_type) and issubclass(attr_type, Base):
-                    if getattr(self, attr) is None:
-                        setattr(self, attr, [obj])
-                    else:
-                        getattr(self, attr).append(obj)
-                    return
+    @classmethod
+    def _get_list_attribute(cls, obj_type: type) -> str:
+        """Return the name of the list attribute for a type."""
+        # NOTE: The lookup table is stored per class so that subclasses
+        # with different list attributes do not share it
+        table = cls.__dict__.get("_list_attribute_table")
+        if table is None:
+            table = {}
+            cls._list_attribute_table = table
+        try:
+            return table[obj_type]
+        except KeyError:
+            pass
+        for attr in cls._list_attributes:
+            attr_type = cls._attributes[attr]
+            if (
+                isclass(attr_type)
+                and issubclass(attr_type, Base)
+                and issubclass(obj_type, attr_type)
+            ):
+                table[obj_type] = attr
+                return attr
         raise TypeError(
-            f"Cannot find a list attribute for type {type(obj).__name__}."
+            f"Cannot find a list attribute for type {obj_type.__name__}."
         )
 
+    def _append(self, obj):
+        attr = self._get_list_attribute(type(obj))
+        if getattr(self, attr) is None:
+            setattr(self, attr, [obj])
+        else:
+            getattr(self, attr).append(obj)
+
     def append(self: ComplexBaseT, obj) -> ComplexBaseT:
         """Append an object to the corresponding list.
 
@@ -683,8 +717,9 @@ class ComplexBase(Base):
         other : :class:`muspy.ComplexBase` or iterable
             If an object of the same type is given, extend the
             list attributes with the corresponding list attributes of
-            the other object. If an iterable is given, call
-            :meth:`muspy.ComplexBase.append` for each item.
+            the other object. If an iterable is given, append each item
+            to the corresponding list as in
+            :meth:`muspy.ComplexBase.append`.
         deepcopy : bool, default: False
             Whether to make deep copies of the appended objects.
 
@@ -706,8 +741,19 @@ class ComplexBase(Base):
                 )
             return self
 
+        # Group the items by their list attributes and extend each list
+        # at once
+        groups: Dict[str, list] = {}
         for item in other:  # type: ignore
-            self._append(copy.deepcopy(item) if deepcopy else item)
+            attr = self._get_list_attribute(type(item))
+            groups.setdefault(attr, []).append(
+                copy.deepcopy(item) if deepcopy else item
+            )
+        for attr, items in groups.items():
+            if getattr(self, attr) is None:
+                setattr(self, attr, items)
+            else:
+                getattr(self, attr).extend(items)
         return self
 
     def _remove_invalid(self, attr: str, recursive: bool):
@@ -823,10 +869,20 @@ class ComplexBase(Base):
         if not getattr(self, attr):
             return
 
-        # Sort the list
+        # Sort the list by time
         attr_type = self._attributes[attr]
         if isclass(attr_type) and issubclass(attr_type, Base):
-            getattr(self, attr).sort()
+            # NOTE: Objects without a `time` attribute (e.g., tracks) are
+            # not comparable, so we only sort time-stamped objects
+            if "time" in attr_type._attributes:
+                list_ = getattr(self, attr)
+                times = np.fromiter(
+                    map(attrgetter("time"), list_), float, len(list_)
+                )
+                if (np.diff(times) < 0).any():
+                    list_[:] = [
+                        list_[idx] for idx in times.argsort(kind="stable")
+                    ]
             # Apply recursively
             if recursive and issubclass(attr_type, ComplexBase):
                 for value in getattr(self, attr):
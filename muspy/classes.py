@@ -61,14 +61,16 @@ def get_end_time(list_: List, is_sorted: bool = False, attr: str = "time"):
     list_ : list
         List of objects.
     is_sorted : bool, default: False
-        Whether the list is sorted.
+        Whether the list is sorted by time. This is only used when
+        `attr` is 'time' since, e.g., the last note in a sorted list
+        does not necessarily end last.
     attr : str, default: 'time'
         Attribute to look for.
 
     """
     if not list_:
         return 0
-    if is_sorted:
+    if is_sorted and attr == "time":
         return getattr(list_[-1], attr)
     return max(getattr(item, attr) for item in list_)
 
@@ -106,6 +108,15 @@ class Metadata(Base):
 
     """
 
+    __slots__ = (
+        "schema_version",
+        "title",
+        "creators",
+        "copyright",
+        "collection",
+        "source_filename",
+        "source_format",
+    )
     _attributes = OrderedDict(
         [
             ("schema_version", str),
@@ -159,6 +170,7 @@ class Tempo(Base):
 
     """
 
+    __slots__ = ("time", "qpm")
     _attributes = OrderedDict([("time", int), ("qpm", (float, int))])
 
     def __init__(self, time: int, qpm: float):
@@ -195,6 +207,7 @@ class KeySignature(Base):
 
     """
 
+    __slots__ = ("time", "root", "mode", "fifths", "root_str")
     _attributes = OrderedDict(
         [
             ("time", int),
@@ -235,6 +248,7 @@ class TimeSignature(Base):
 
     """
 
+    __slots__ = ("time", "numerator", "denominator")
     _attributes = OrderedDict(
         [("time", int), ("numerator", int), ("denominator", int)]
     )
@@ -262,6 +276,7 @@ class Beat(Base):
 
     """
 
+    __slots__ = ("time",)
     _attributes = OrderedDict([("time", int)])
 
     def __init__(self, time: int):
@@ -278,6 +293,7 @@ class Barline(Base):
 
     """
 
+    __slots__ = ("time",)
     _attributes = OrderedDict([("time", int)])
 
     def __init__(self, time: int):
@@ -296,6 +312,7 @@ class Lyric(Base):
 
     """
 
+    __slots__ = ("time", "lyric")
     _attributes = OrderedDict([("time", int), ("lyric", str)])
 
     def __init__(self, time: int, lyric: str):
@@ -317,6 +334,7 @@ class Annotation(Base):
 
     """
 
+    __slots__ = ("time", "annotation", "group")
     _attributes = OrderedDict(
         [("time", int), ("annotation", object), ("group", str)]
     )
@@ -347,6 +365,7 @@ class Note(Base):
 
     """
 
+    __slots__ = ("time", "pitch", "duration", "velocity", "pitch_str")
     _attributes = OrderedDict(
         [
             ("time", int),
@@ -496,6 +515,7 @@ class Chord(Base):
 
     """
 
+    __slots__ = ("time", "pitches", "duration", "velocity", "pitches_str")
     _attributes = OrderedDict(
         [
             ("time", int),
@@ -606,7 +626,7 @@ class Chord(Base):
         Object itself.
 
         """
-        self.pitches += [pitch + semitone for pitch in self.pitches]
+        self.pitches = [pitch + semitone for pitch in self.pitches]
         return self
 
     def clip(self: ChordT, lower: int = 0, upper: int = 127) -> ChordT:
@@ -666,6 +686,15 @@ class Track(ComplexBase):
 
     """
 
+    __slots__ = (
+        "program",
+        "is_drum",
+        "name",
+        "notes",
+        "chords",
+        "lyrics",
+        "annotations",
+    )
     _attributes = OrderedDict(
         [
             ("program", int),
@@ -691,7 +720,7 @@ class Track(ComplexBase):
         annotations: List[Annotation] = None,
     ):
         self.program = program if program is not None else 0
-        self.is_drum = is_drum if program is not None else False
+        self.is_drum = is_drum if is_drum is not None else False
         self.name = name
         self.notes = notes if notes is not None else []
         self.chords = chords if chords is not None else []
@@ -767,8 +796,10 @@ class Track(ComplexBase):
         Object itself.
 
         """
+        # NOTE: Update the pitches directly to avoid the overhead of a
+        # method call per note
         for note in self.notes:
-            note.transpose(semitone)
+            note.pitch += semitone
         return self
 
     def trim(self: TrackT, end: int) -> TrackT:
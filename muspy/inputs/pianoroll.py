@@ -1,11 +1,9 @@
 """Piano-roll input interface."""
 from operator import attrgetter
-from typing import List
+from typing import TYPE_CHECKING, List
 
 import numpy as np
 from numpy import ndarray
-from pypianoroll import Multitrack
-from pypianoroll import Track as PypianorollTrack
 
 from ..classes import (
     DEFAULT_VELOCITY,
@@ -18,6 +16,10 @@ from ..classes import (
 )
 from ..music import DEFAULT_RESOLUTION, Music
 
+if TYPE_CHECKING:
+    from pypianoroll import Multitrack
+    from pypianoroll import Track as PypianorollTrack
+
 
 def _pianoroll_to_notes(
     array: ndarray, encode_velocity: bool, default_velocity: int
@@ -48,7 +50,7 @@ def _pianoroll_to_notes(
 
 
 def from_pypianoroll_track(
-    track: PypianorollTrack, default_velocity: int = DEFAULT_VELOCITY
+    track: "PypianorollTrack", default_velocity: int = DEFAULT_VELOCITY
 ) -> Track:
     """Return a Pypianoroll Track object as a Track object.
 
@@ -78,7 +80,7 @@ def from_pypianoroll_track(
 
 
 def from_pypianoroll(
-    multitrack: Multitrack, default_velocity: int = DEFAULT_VELOCITY
+    multitrack: "Multitrack", default_velocity: int = DEFAULT_VELOCITY
 ) -> Music:
     """Return a Pypianoroll Multitrack object as a Music object.
 
@@ -1,12 +1,11 @@
 """Wrapper functions for input interface."""
 from pathlib import Path
-from typing import List, TextIO, Union
+from typing import TYPE_CHECKING, List, TextIO, Union
 
 from mido import MidiFile
 from music21.stream import Stream
 from numpy import ndarray
 from pretty_midi import PrettyMIDI
-from pypianoroll import Multitrack
 
 from ..classes import Track
 from ..music import Music
@@ -22,6 +21,9 @@ from .pianoroll import from_pianoroll_representation, from_pypianoroll
 from .pitch import from_pitch_representation
 from .yaml import load_yaml
 
+if TYPE_CHECKING:
+    from pypianoroll import Multitrack
+
 
 def load(path: Union[str, Path, TextIO], kind: str = None, **kwargs) -> Music:
     """Load a JSON or a YAML file into a Music object.
@@ -128,7 +130,7 @@ def read(
 
 
 def from_object(
-    obj: Union[Stream, MidiFile, PrettyMIDI, Multitrack], **kwargs
+    obj: Union[Stream, MidiFile, PrettyMIDI, "Multitrack"], **kwargs
 ) -> Union[Music, List[Music], Track, List[Track]]:
     """Return an outside object as a Music object.
 
@@ -155,6 +157,11 @@ def from_object(
         return from_mido(obj, **kwargs)
     if isinstance(obj, PrettyMIDI):
         return from_pretty_midi(obj, **kwargs)
+
+    # NOTE: Pypianoroll is imported lazily as it is slow to import
+    # pylint: disable=import-outside-toplevel
+    from pypianoroll import Multitrack
+
     if isinstance(obj, Multitrack):
         return from_pypianoroll(obj, **kwargs)
     raise TypeError(
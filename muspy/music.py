@@ -17,14 +17,17 @@ Variables
 from collections import OrderedDict
 from math import ceil, floor
 from pathlib import Path
-from typing import Any, Callable, List, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
-from mido import MidiFile
-from music21.stream import Stream
 from numpy import ndarray
-from pretty_midi import PrettyMIDI
-from pypianoroll import Multitrack
 
 from .base import ComplexBase
 from .classes import (
@@ -39,8 +42,34 @@ from .classes import (
     Track,
     get_end_time,
 )
-from .outputs import save, synthesize, to_object, to_representation, write
-from .visualization import show
+from .outputs import (
+    save,
+    save_json,
+    save_yaml,
+    synthesize,
+    to_event_representation,
+    to_mido,
+    to_music21,
+    to_note_representation,
+    to_object,
+    to_pianoroll_representation,
+    to_pitch_representation,
+    to_pretty_midi,
+    to_pypianoroll,
+    to_representation,
+    write,
+    write_audio,
+    write_midi,
+    write_musicxml,
+)
+from .visualization import show, show_pianoroll, show_score
+
+if TYPE_CHECKING:
+    from mido import MidiFile
+    from music21.stream import Stream
+    from pretty_midi import PrettyMIDI
+    from pypianoroll import Multitrack
+    from scipy.sparse import csr_matrix
 
 DEFAULT_RESOLUTION = 24
 MusicT = TypeVar("MusicT", bound="Music")
@@ -98,6 +127,18 @@ class Music(ComplexBase):
 
     """
 
+    __slots__ = (
+        "metadata",
+        "resolution",
+        "tempos",
+        "key_signatures",
+        "time_signatures",
+        "barlines",
+        "beats",
+        "lyrics",
+        "annotations",
+        "tracks",
+    )
     _attributes = OrderedDict(
         [
             ("metadata", Metadata),
@@ -189,23 +230,21 @@ class Music(ComplexBase):
             Whether all the list attributes are sorted.
 
         """
-        if self.tracks:
-            track_end_time = max(
-                track.get_end_time(is_sorted) for track in self.tracks
-            )
-        else:
-            track_end_time = 0
-
-        end_time = max(
-            get_end_time(self.tempos, is_sorted),
-            get_end_time(self.key_signatures, is_sorted),
-            get_end_time(self.time_signatures, is_sorted),
-            get_end_time(self.barlines, is_sorted),
-            get_end_time(self.beats, is_sorted),
-            get_end_time(self.lyrics, is_sorted),
-            get_end_time(self.annotations, is_sorted),
-            track_end_time,
-        )
+        end_time = 0
+        for attr in self._list_attributes:
+            list_ = getattr(self, attr)
+            # Skip empty lists
+            if not list_:
+                continue
+            if attr == "tracks":
+                for track in list_:
+                    track_end_time = track.get_end_time(is_sorted)
+                    if track_end_time > end_time:
+                        end_time = track_end_time
+            else:
+                list_end_time = get_end_time(list_, is_sorted)
+                if list_end_time > end_time:
+                    end_time = list_end_time
 
         return end_time
 
@@ -440,6 +479,8 @@ class Music(ComplexBase):
         Drum tracks are skipped.
 
         """
+        if semitone == 0:
+            return self
         for track in self.tracks:
             if not track.is_drum:
                 track.transpose(semitone)
@@ -485,15 +526,15 @@ class Music(ComplexBase):
         Refer to :func:`muspy.save_json` for full documentation.
 
         """
-        return save(path, self, kind="json", **kwargs)
+        return save_json(path, self, **kwargs)
 
-    def save_yaml(self, path: Union[str, Path]):
+    def save_yaml(self, path: Union[str, Path], **kwargs: Any):
         """Save loselessly to a YAML file.
 
         Refer to :func:`muspy.save_yaml` for full documentation.
 
         """
-        return save(path, self, kind="yaml")
+        return save_yaml(path, self, **kwargs)
 
     def write(self, path: Union[str, Path], kind: str = None, **kwargs: Any):
         """Write to a MIDI, a MusicXML, an ABC or an audio file.
@@ -509,7 +550,7 @@ class Music(ComplexBase):
         Refer to :func:`muspy.write_midi` for full documentation.
 
         """
-        return write(path, self, kind="midi", **kwargs)
+        return write_midi(path, self, **kwargs)
 
     def write_musicxml(self, path: Union[str, Path], **kwargs: Any):
         """Write to a MusicXML file.
@@ -517,7 +558,7 @@ class Music(ComplexBase):
         Refer to :func:`muspy.write_musicxml` for full documentation.
 
         """
-        return write(path, self, kind="musicxml", **kwargs)
+        return write_musicxml(path, self, **kwargs)
 
     def write_abc(self, path: Union[str, Path], **kwargs: Any):
         """Write to an ABC file.
@@ -533,7 +574,7 @@ class Music(ComplexBase):
         Refer to :func:`muspy.write_audio` for full documentation.
 
         """
-        return write(path, self, kind="audio", **kwargs)
+        return write_audio(path, self, **kwargs)
 
     def to_object(self, kind: str, **kwargs: Any):
         """Return as an object in other libraries.
@@ -543,37 +584,37 @@ class Music(ComplexBase):
         """
         return to_object(self, kind=kind, **kwargs)
 
-    def to_music21(self, **kwargs: Any) -> Stream:
+    def to_music21(self, **kwargs: Any) -> "Stream":
         """Return as a Stream object.
 
         Refer to :func:`muspy.to_music21` for full documentation.
 
         """
-        return to_object(self, kind="music21", **kwargs)
+        return to_music21(self, **kwargs)
 
-    def to_mido(self, **kwargs: Any) -> MidiFile:
+    def to_mido(self, **kwargs: Any) -> "MidiFile":
         """Return as a MidiFile object.
 
         Refer to :func:`muspy.to_mido` for full documentation.
 
         """
-        return to_object(self, kind="mido", **kwargs)
+        return to_mido(self, **kwargs)
 
-    def to_pretty_midi(self, **kwargs: Any) -> PrettyMIDI:
+    def to_pretty_midi(self, **kwargs: Any) -> "PrettyMIDI":
         """Return as a PrettyMIDI object.
 
         Refer to :func:`muspy.to_pretty_midi` for full documentation.
 
         """
-        return to_object(self, kind="pretty_midi", **kwargs)
+        return to_pretty_midi(self, **kwargs)
 
-    def to_pypianoroll(self, **kwargs: Any) -> Multitrack:
+    def to_pypianoroll(self, **kwargs: Any) -> "Multitrack":
         """Return as a Multitrack object.
 
         Refer to :func:`muspy.to_pypianoroll` for full documentation.
 
         """
-        return to_object(self, kind="pypianoroll", **kwargs)
+        return to_pypianoroll(self, **kwargs)
 
     def to_representation(self, kind: str, **kwargs: Any) -> ndarray:
         """Return in a specific representation.
@@ -590,16 +631,18 @@ class Music(ComplexBase):
         documentation.
 
         """
-        return to_representation(self, kind="pitch", **kwargs)
+        return to_pitch_representation(self, **kwargs)
 
-    def to_pianoroll_representation(self, **kwargs: Any) -> ndarray:
+    def to_pianoroll_representation(
+        self, **kwargs: Any
+    ) -> Union[ndarray, "csr_matrix"]:
         """Return in piano-roll representation.
 
         Refer to :func:`muspy.to_pianoroll_representation` for full
         documentation.
 
         """
-        return to_representation(self, kind="piano-roll", **kwargs)
+        return to_pianoroll_representation(self, **kwargs)
 
     def to_event_representation(self, **kwargs: Any) -> ndarray:
         """Return in event-based representation.
@@ -608,7 +651,7 @@ class Music(ComplexBase):
         documentation.
 
         """
-        return to_representation(self, kind="event", **kwargs)
+        return to_event_representation(self, **kwargs)
 
     def to_note_representation(self, **kwargs: Any) -> ndarray:
         """Return in note-based representation.
@@ -617,7 +660,7 @@ class Music(ComplexBase):
         documentation.
 
         """
-        return to_representation(self, kind="note", **kwargs)
+        return to_note_representation(self, **kwargs)
 
     def show(self, kind: str, **kwargs: Any):
         """Show visualization.
@@ -633,7 +676,7 @@ class Music(ComplexBase):
         Refer to :func:`muspy.show_score` for full documentation.
 
         """
-        return show(self, kind="score", **kwargs)
+        return show_score(self, **kwargs)
 
     def show_pianoroll(self, **kwargs: Any):
         """Show pianoroll visualization.
@@ -641,7 +684,7 @@ class Music(ComplexBase):
         Refer to :func:`muspy.show_pianoroll` for full documentation.
 
         """
-        return show(self, kind="piano-roll", **kwargs)
+        return show_pianoroll(self, **kwargs)
 
     def synthesize(self, **kwargs) -> ndarray:
         """Synthesize a Music object to raw audio.
@@ -1,7 +1,8 @@
 """Event-based representation output interface."""
+from itertools import chain
 from math import ceil
 from operator import attrgetter, itemgetter
-from typing import TYPE_CHECKING, Iterable, List, Tuple
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple
 
 import numpy as np
 from bidict import bidict
@@ -11,6 +12,28 @@ if TYPE_CHECKING:
     from ..music import Music
 
 
+def _iter_event_codes(
+    note_events: List[Tuple[int, int]],
+    offset_time_shift: int,
+    max_time_shift: int,
+) -> Iterator[int]:
+    """Yield the event codes for a list of sorted note events."""
+    # Initialize the time cursor
+    time_cursor = 0
+    # Iterate over note events
+    for time, code in note_events:
+        # If event time is after the time cursor, yield tick shift
+        # events
+        if time > time_cursor:
+            div, mod = divmod(time - time_cursor, max_time_shift)
+            for _ in range(div):
+                yield offset_time_shift + max_time_shift - 1
+            if mod > 0:
+                yield offset_time_shift + mod - 1
+            time_cursor = time
+        yield code
+
+
 def to_event_representation(
     music: "Music",
     use_single_note_off_event: bool = False,
@@ -108,29 +131,15 @@ def to_event_representation(
     # Sort events by time
     note_events.sort(key=itemgetter(0))
 
-    # Create a list for all events
-    events = []
-    # Initialize the time cursor
-    time_cursor = 0
-    # Iterate over note events
-    for time, code in note_events:
-        # If event time is after the time cursor, append tick shift
-        # events
-        if time > time_cursor:
-            div, mod = divmod(time - time_cursor, max_time_shift)
-            for _ in range(div):
-                events.append(offset_time_shift + max_time_shift - 1)
-            if mod > 0:
-                events.append(offset_time_shift + mod - 1)
-            events.append(code)
-            time_cursor = time
-        else:
-            events.append(code)
+    # Stream the events into the array without an intermediate list
+    events = _iter_event_codes(
+        note_events, offset_time_shift, max_time_shift
+    )
     # Append the end-of-sequence event
     if use_end_of_sequence_event:
-        events.append(offset_eos)
+        events = chain(events, (offset_eos,))
 
-    return np.array(events, dtype=dtype).reshape(-1, 1)
+    return np.fromiter(events, dtype).reshape(-1, 1)
 
 
 class EventSequence:
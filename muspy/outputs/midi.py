@@ -1,4 +1,5 @@
 """MIDI output interface."""
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Union
 
@@ -46,7 +47,7 @@ def to_delta_time(midi_track: MidiTrack):
 
     """
     # Sort messages by absolute time
-    midi_track.sort(key=lambda x: x.time)
+    midi_track.sort(key=attrgetter("time"))
 
     # Convert to delta time
     time = 0
@@ -1,16 +1,31 @@
 """Note-based representation output interface."""
 from operator import attrgetter
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterator, List, Union
 
 import numpy as np
 from numpy import ndarray
 
-from ..classes import DEFAULT_VELOCITY
+from ..classes import DEFAULT_VELOCITY, Note
 
 if TYPE_CHECKING:
     from ..music import Music
 
 
+def _iter_note_values(
+    notes: List[Note], use_start_end: bool, encode_velocity: bool
+) -> Iterator[int]:
+    """Yield the encoded values of a list of notes in row-major order."""
+    for note in notes:
+        yield note.time
+        yield note.pitch
+        yield note.end if use_start_end else note.duration
+        if encode_velocity:
+            if note.velocity is not None:
+                yield note.velocity
+            else:
+                yield DEFAULT_VELOCITY
+
+
 def to_note_representation(
     music: "Music",
     use_start_end: bool = False,
@@ -57,21 +72,12 @@ def to_note_representation(
     # Sort the notes
     notes.sort(key=attrgetter("time", "pitch", "duration", "velocity"))
 
-    # Initialize the array
-    if encode_velocity:
-        array = np.zeros((len(notes), 4), dtype)
-    else:
-        array = np.zeros((len(notes), 3), dtype)
-
     # Encode notes
-    for i, note in enumerate(notes):
-        array[i, 0] = note.time
-        array[i, 1] = note.pitch
-        array[i, 2] = note.end if use_start_end else note.duration
-        if encode_velocity:
-            if note.velocity is not None:
-                array[i, 3] = note.velocity
-            else:
-                array[i, 3] = DEFAULT_VELOCITY
+    n_values = 4 if encode_velocity else 3
+    array = np.fromiter(
+        _iter_note_values(notes, use_start_end, encode_velocity),
+        dtype,
+        len(notes) * n_values,
+    )
 
-    return array
+    return array.reshape(-1, n_values)
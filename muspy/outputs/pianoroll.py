@@ -1,18 +1,20 @@
 """Piano-roll output interface."""
 from operator import attrgetter
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, List, Union
 
 import numpy as np
 from numpy import ndarray
-from pypianoroll import Multitrack, Track
 
-from ..classes import DEFAULT_VELOCITY
+from ..classes import DEFAULT_VELOCITY, Note
 
 if TYPE_CHECKING:
+    from pypianoroll import Multitrack
+    from scipy.sparse import csr_matrix
+
     from ..music import Music
 
 
-def to_pypianoroll(music: "Music") -> Multitrack:
+def to_pypianoroll(music: "Music") -> "Multitrack":
     """Return a Music object as a Multitrack object.
 
     Parameters
@@ -26,6 +28,10 @@ def to_pypianoroll(music: "Music") -> Multitrack:
         Converted Multitrack object.
 
     """
+    # NOTE: Pypianoroll is imported lazily as it is slow to import
+    # pylint: disable=import-outside-toplevel
+    from pypianoroll import Multitrack, Track
+
     length = music.get_end_time()
 
     # Tracks
@@ -33,10 +39,9 @@ def to_pypianoroll(music: "Music") -> Multitrack:
     for track in music.tracks:
         pianoroll = np.zeros((length, 128))
         for note in track.notes:
-            if note.velocity is not None:
-                pianoroll[note.time : note.end, note.pitch] = note.velocity
-            else:
-                pianoroll[note.time : note.end, note.pitch] = DEFAULT_VELOCITY
+            pianoroll[note.time : note.end, note.pitch] = _note_value(
+                note, True
+            )
         track = Track(
             program=track.program,
             is_drum=track.is_drum,
@@ -98,11 +103,100 @@ def to_pypianoroll(music: "Music") -> Multitrack:
     return multitrack
 
 
+def _note_value(note: Note, encode_velocity: bool) -> Union[int, bool]:
+    """Return the value to fill in the piano roll for a note."""
+    if note.velocity is not None:
+        if encode_velocity:
+            return note.velocity
+        return note.velocity > 0
+    if encode_velocity:
+        return DEFAULT_VELOCITY
+    return True
+
+
+def _to_sparse_pianoroll(
+    notes: List[Note],
+    length: int,
+    encode_velocity: bool,
+    dtype: Union[np.dtype, type, str],
+    block_size: int = 4096,
+) -> "csr_matrix":
+    """Encode sorted notes into a sparse piano roll.
+
+    The notes are rasterized into a small dense block of time steps at a
+    time, and only the nonzero entries of each block are kept, so the
+    full dense array is never allocated.
+
+    """
+    # NOTE: SciPy is imported lazily as it is slow to import
+    # pylint: disable=import-outside-toplevel
+    from scipy.sparse import csr_matrix
+
+    # Allocate the output for the maximum number of nonzero entries
+    n_rows = length + 1
+    max_nnz = min(
+        sum(max(note.end - note.time, 0) for note in notes), n_rows * 128
+    )
+    if max(n_rows, max_nnz) <= np.iinfo(np.int32).max:
+        index_dtype = np.int32
+    else:
+        index_dtype = np.int64
+    indptr = np.zeros(n_rows + 1, index_dtype)
+    indices = np.empty(max_nnz, index_dtype)
+    data = np.empty(max_nnz, dtype)
+
+    block = np.zeros((block_size, 128), dtype)
+    active: List[Note] = []
+    idx = 0
+    nnz = 0
+    for start in range(0, n_rows, block_size):
+        end = min(start + block_size, n_rows)
+
+        # Collect the notes that overlap with the block, keeping their
+        # order so that later notes overwrite earlier ones
+        while idx < len(notes) and notes[idx].time < end:
+            active.append(notes[idx])
+            idx += 1
+        if not active:
+            continue
+
+        # Encode notes into the block
+        block[:] = 0
+        for note in active:
+            onset = max(note.time - start, 0)
+            offset = note.end - start
+            if offset <= onset:
+                continue
+            block[onset:offset, note.pitch] = _note_value(
+                note, encode_velocity
+            )
+        active = [note for note in active if note.end > end]
+
+        # Keep only the nonzero entries
+        flat_block = block[: end - start].ravel()
+        flat_indices = np.flatnonzero(flat_block)
+        count = len(flat_indices)
+        indices[nnz : nnz + count] = flat_indices % 128
+        data[nnz : nnz + count] = flat_block[flat_indices]
+        indptr[start + 1 : end + 1] = np.bincount(
+            flat_indices // 128, minlength=end - start
+        )
+        nnz += count
+
+    # Release the unused space
+    indices.resize(nnz, refcheck=False)
+    data.resize(nnz, refcheck=False)
+    np.cumsum(indptr, out=indptr)
+
+    return csr_matrix((data, indices, indptr), shape=(n_rows, 128))
+
+
 def to_pianoroll_representation(
     music: "Music",
     encode_velocity: bool = True,
     dtype: Union[np.dtype, type, str] = None,
-) -> ndarray:
+    sparse: bool = False,
+) -> Union[ndarray, "csr_matrix"]:
     """Encode notes into piano-roll representation.
 
     Parameters
@@ -115,10 +209,15 @@ def to_pianoroll_representation(
     dtype : np.dtype, type or str, optional
         Data type of the return array. Defaults to uint8 if
         `encode_velocity` is True, otherwise bool.
+    sparse : bool, default: False
+        Whether to return a sparse matrix. The dense array is never
+        allocated, which saves memory when only a small fraction of
+        the entries are nonzero, e.g., for long songs with few
+        simultaneous notes.
 
     Returns
     -------
-    ndarray, shape=(?, 128)
+    ndarray or :class:`scipy.sparse.csr_matrix`, shape=(?, 128)
         Encoded array in piano-roll representation.
 
     """
@@ -140,20 +239,19 @@ def to_pianoroll_representation(
     if not notes:
         return np.zeros((0, 128), dtype)
 
-    # Initialize the array
     length = max((note.end for note in notes))
+
+    # Encode notes into a sparse matrix
+    if sparse:
+        return _to_sparse_pianoroll(notes, length, encode_velocity, dtype)
+
+    # Initialize the array
     array = np.zeros((length + 1, 128), dtype)
 
     # Encode notes
     for note in notes:
-        if note.velocity is not None:
-            if encode_velocity:
-                array[note.time : note.end, note.pitch] = note.velocity
-            else:
-                array[note.time : note.end, note.pitch] = note.velocity > 0
-        elif encode_velocity:
-            array[note.time : note.end, note.pitch] = DEFAULT_VELOCITY
-        else:
-            array[note.time : note.end, note.pitch] = True
+        array[note.time : note.end, note.pitch] = _note_value(
+            note, encode_velocity
+        )
 
     return array
@@ -2,11 +2,7 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, TextIO, Union
 
-from mido import MidiFile
-from music21.stream import Stream
 from numpy import ndarray
-from pretty_midi import PrettyMIDI
-from pypianoroll import Multitrack
 
 from .audio import write_audio
 from .event import to_event_representation
@@ -20,8 +16,35 @@ from .pitch import to_pitch_representation
 from .yaml import save_yaml
 
 if TYPE_CHECKING:
+    from mido import MidiFile
+    from music21.stream import Stream
+    from pretty_midi import PrettyMIDI
+    from pypianoroll import Multitrack
+    from scipy.sparse import csr_matrix
+
     from ..music import Music
 
+_OBJECT_CONVERTERS = {
+    "music21": to_music21,
+    "mido": to_mido,
+    "prettymidi": to_pretty_midi,
+    "pypianoroll": to_pypianoroll,
+}
+_REPRESENTATION_ENCODERS = {
+    "pitch": to_pitch_representation,
+    "pitchbased": to_pitch_representation,
+    "pianoroll": to_pianoroll_representation,
+    "event": to_event_representation,
+    "eventbased": to_event_representation,
+    "note": to_note_representation,
+    "notebased": to_note_representation,
+}
+
+
+def _normalize_kind(kind: str) -> str:
+    """Return a kind string in lowercase without separators."""
+    return kind.lower().replace("-", "").replace("_", "").replace(" ", "")
+
 
 def save(
     path: Union[str, Path, TextIO], music: "Music", kind: str = None, **kwargs,
@@ -129,7 +152,7 @@ def write(
 
 def to_object(
     music: "Music", kind: str, **kwargs
-) -> Union[Stream, MidiFile, PrettyMIDI, Multitrack]:
+) -> Union["Stream", "MidiFile", "PrettyMIDI", "Multitrack"]:
     """Return a Music object as an object in other libraries.
 
     Supported classes are `music21.Stream`, :class:`mido.MidiTrack`,
@@ -141,6 +164,10 @@ def to_object(
         Music object to convert.
     kind : str, {'music21', 'mido', 'pretty_midi', 'pypianoroll'}
         Target class.
+    **kwargs
+        Keyword arguments to pass to :func:`muspy.to_music21`,
+        :func:`muspy.to_mido`, :func:`muspy.to_pretty_midi` or
+        :func:`muspy.to_pypianoroll`.
 
     Returns
     -------
@@ -150,21 +177,18 @@ def to_object(
         Converted object.
 
     """
-    if kind.lower() == "music21":
-        return to_music21(music)
-    if kind.lower() == "mido":
-        return to_mido(music, **kwargs)
-    if kind.lower() in ("pretty_midi", "prettymidi", "pretty-midi"):
-        return to_pretty_midi(music)
-    if kind.lower() == "pypianoroll":
-        return to_pypianoroll(music)
-    raise ValueError(
-        "Expect `kind` to be 'music21', 'mido', 'pretty_midi' or "
-        f"'pypianoroll', but got : {kind}."
-    )
+    converter = _OBJECT_CONVERTERS.get(_normalize_kind(kind))
+    if converter is None:
+        raise ValueError(
+            "Expect `kind` to be 'music21', 'mido', 'pretty_midi' or "
+            f"'pypianoroll', but got : {kind}."
+        )
+    return converter(music, **kwargs)
 
 
-def to_representation(music: "Music", kind: str, **kwargs) -> ndarray:
+def to_representation(
+    music: "Music", kind: str, **kwargs
+) -> Union[ndarray, "csr_matrix"]:
     """Return a Music object in a specific representation.
 
     Parameters
@@ -176,19 +200,14 @@ def to_representation(music: "Music", kind: str, **kwargs) -> ndarray:
 
     Returns
     -------
-    array : ndarray
+    array : ndarray or :class:`scipy.sparse.csr_matrix`
         Converted representation.
 
     """
-    if kind.lower() in ("pitch", "pitch-based"):
-        return to_pitch_representation(music, **kwargs)
-    if kind.lower() in ("piano-roll", "pianoroll", "piano roll"):
-        return to_pianoroll_representation(music, **kwargs)
-    if kind.lower() in ("event", "event-based"):
-        return to_event_representation(music, **kwargs)
-    if kind.lower() in ("note", "note-based"):
-        return to_note_representation(music, **kwargs)
-    raise ValueError(
-        "Expect `kind` to be 'pitch', 'pianoroll', 'event' or 'note', but"
-        f"got : {kind}."
-    )
+    encoder = _REPRESENTATION_ENCODERS.get(_normalize_kind(kind))
+    if encoder is None:
+        raise ValueError(
+            "Expect `kind` to be 'pitch', 'pianoroll', 'event' or 'note', "
+            f"but got : {kind}."
+        )
+    return encoder(music, **kwargs)
@@ -9,10 +9,7 @@ from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt
 from matplotlib.artist import Artist
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 from matplotlib.font_manager import FontProperties
 from matplotlib.lines import Line2D
 from matplotlib.patches import Arc, Rectangle
@@ -23,6 +20,9 @@ from ..classes import KeySignature, Note, Tempo, TimeSignature
 from ..external import get_bravura_font_path
 
 if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
     from ..music import Music
 
 
@@ -323,8 +323,8 @@ class ScorePlotter:
 
     def __init__(
         self,
-        fig: Figure,
-        ax: Axes,
+        fig: "Figure",
+        ax: "Axes",
         resolution: int,
         note_spacing: int = None,
         font_path: Union[str, Path] = None,
@@ -815,6 +815,10 @@ def show_score(
         A ScorePlotter object that handles the score.
 
     """
+    # NOTE: Pyplot is imported lazily as it is slow to import
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.pyplot as plt
+
     # Create a figure
     fig = plt.figure(figsize=figsize)
 